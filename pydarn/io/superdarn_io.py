@@ -43,11 +43,12 @@ class SuperDARNRead(pydarnio.SDarnRead):
         # bz2
         if 'bz2' in filename:
             with bz2.open(filename) as fp:
-                dmap_stream = fp.read()
-
-            super().__init__(dmap_stream, stream=True)
+                dmap_source = fp.read()
+            stream = True
         else:
-            super().__init__(filename)
+            dmap_source = filename
+            stream = False
+        super().__init__(dmap_source, stream=stream)
 
         try:
             # Check which file type it is
@@ -56,7 +57,7 @@ class SuperDARNRead(pydarnio.SDarnRead):
             elif 'fitacf' in filename:
                 data = self.read_fitacf()
             elif 'iqdat' in filename:
-                self.read_iqdat()
+                data = self.read_iqdat()
             # if not noticeable then just read the file
             else:
                 data = self.read_records()
@@ -69,7 +70,10 @@ class SuperDARNRead(pydarnio.SDarnRead):
             print("..... Will try to read DMap file with read_dmap")
             print(" IF THIS FAILS please make an issue on pyDARNio, not "
                   "pyDARN's issue")
-            data = self.read_records
+            # start over with a fresh reader so records from the failed
+            # attempt are not mixed in with the DMap records
+            super().__init__(dmap_source, stream=stream)
+            data = self.read_records()
         return data
 
     def read_borealis(self, filename: str, slice_id: int = None):
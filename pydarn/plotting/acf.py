@@ -210,7 +210,7 @@ class ACF():
                           "to other control programs. The ACF plot may "
                           "not be correct. Please contact the PI of the "
                           "radar to confirm if the data looks correct.")
-        if re == [] or im == []:
+        if not re or not im:
             if gate_num > 0 and gate_num < record['nrang']:
                 time = time2datetime(record)
                 raise plot_exceptions.\
@@ -318,7 +318,7 @@ class ACF():
                                          marker=blank_marker)
 
             # generate generic legend
-            if legend and blanked_lags != []:
+            if legend and blanked_lags:
                 line_re.set_label('Real Blanked')
                 line_im.set_label('Imaginary Blanked')
                 if pwr_and_phs is True:
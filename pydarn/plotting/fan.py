@@ -207,7 +207,7 @@ class Fan():
 
         # Plot FOV outline
         stid = dmap_data[0]['stid']
-        if ranges == [] or ranges is None:
+        if not ranges:
             try:
                 # If not given, get ranges from data file
                 ranges = [0, dmap_data[0]['nrang']]
@@ -444,7 +444,7 @@ class Fan():
             beam_corners_lon - theta polar coordinates
             rs - radius polar coordinates
         """
-        if ranges == [] or ranges is None:
+        if not ranges:
             ranges = [0, SuperDARNRadars.radars[stid].range_gate_45]
 
         if not date:
@@ -19,11 +19,11 @@ Grid plots
 """
 
 import datetime as dt
-import matplotlib.pyplot as plt
 import numpy as np
 import warnings
 
 from matplotlib import ticker, cm, colors
+from matplotlib.collections import LineCollection
 from typing import List
 
 # Third party libraries
@@ -146,45 +146,53 @@ class Grid():
 
         # Find the record corresponding to the start time
         if start_time is not None:
-            for record in range(len(dmap_data)):
-                date = dt.datetime(dmap_data[record]['start.year'],
-                                   dmap_data[record]['start.month'],
-                                   dmap_data[record]['start.day'],
-                                   dmap_data[record]['start.hour'],
-                                   dmap_data[record]['start.minute'])
-                time_diff = date - start_time
-                if time_diff.seconds/60 <= time_delta:
-                    break
-            if time_diff.seconds/60 > time_delta:
+            # Records are in time order, so the first record at or after
+            # the start time can be found with a binary search. The record
+            # start times are built without a datetime object per record
+            year, month, day, hour, minute = \
+                (np.fromiter((rec[field] for rec in dmap_data), dtype=int,
+                             count=len(dmap_data))
+                 for field in ['start.year', 'start.month', 'start.day',
+                               'start.hour', 'start.minute'])
+            record_times = (year - 1970).astype('datetime64[Y]') +\
+                (month - 1).astype('timedelta64[M]') +\
+                (day - 1).astype('timedelta64[D]') +\
+                hour.astype('timedelta64[h]') +\
+                minute.astype('timedelta64[m]')
+            start = np.datetime64(start_time, 'us')
+            record = int(np.searchsorted(record_times, start))
+            if record == len(dmap_data) or \
+                    (record_times[record] - start) / \
+                    np.timedelta64(1, 'm') > time_delta:
                 raise plot_exceptions.NoDataFoundError(parameter,
                                                        start_time=start_time)
-        else:
-            # Record is read in or default to 0
-            date = dt.datetime(dmap_data[record]['start.year'],
-                               dmap_data[record]['start.month'],
-                               dmap_data[record]['start.day'],
-                               dmap_data[record]['start.hour'],
-                               dmap_data[record]['start.minute'])
+
+        # Record is found from the start time or read in or default to 0
+        dmap_record = dmap_data[record]
+        date = dt.datetime(dmap_record['start.year'],
+                           dmap_record['start.month'],
+                           dmap_record['start.day'],
+                           dmap_record['start.hour'],
+                           dmap_record['start.minute'])
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             # Check for partial records
-            if all(dmap_data[record]['nvec'] == 0) :
+            if all(dmap_record['nvec'] == 0) :
                 raise plot_exceptions.PartialRecordsError('~all vectors~')
     
-            data_lons = dmap_data[record]['vector.mlon']
-            data_lats = dmap_data[record]['vector.mlat']
+            data_lons = dmap_record['vector.mlon']
+            data_lats = dmap_record['vector.mlat']
 
             # Hemisphere is not found in grid files so take from latitudes
-            hemisphere = Hemisphere(np.sign(
-                                    dmap_data[record]['vector.mlat'][0]))
+            hemisphere = Hemisphere(np.sign(data_lats[0]))
             ax, ccrs = projs(date=date, ax=ax, hemisphere=hemisphere, **kwargs)
             if ccrs is None:
                 transform = ax.transData
             else:
                 transform = ccrs.PlateCarree()
 
-            for stid in dmap_data[record]['stid']:
+            for stid in dmap_record['stid']:
                 _, coord_lons, ax, ccrs =\
                         Fan.plot_fov(stid, date, ax=ax, ccrs=ccrs,
                                      coords=coords, projs=projs, **kwargs)
@@ -238,7 +246,7 @@ class Grid():
                         'vector.vel.median': 'plasma_r',
                         'vector.wdt.median':
                         PyDARNColormaps.PYDARN_VIRIDIS}
-                cmap = plt.cm.get_cmap(cmap[parameter])
+                cmap = cm.get_cmap(cmap[parameter])
 
             # Setting zmin and zmax
             defaultzminmax = {'vector.pwr.median': [0, 50],
@@ -256,7 +264,7 @@ class Grid():
             # this may not be the case for wdt and pwr as you need -xtd
             # option in make_grid
             try:
-                data = dmap_data[record][parameter]
+                data = dmap_record[parameter]
             except KeyError:
                 raise plot_exceptions.UnknownParameterError(parameter,
                                                             grid=True)
@@ -268,51 +276,52 @@ class Grid():
             if parameter == "vector.vel.median":
 
                 # Get the azimuths from the data
-                azm_v = dmap_data[record]['vector.kvect']
+                azm_v = dmap_record['vector.kvect']
 
-                # Number of data points
-                num_pts = range(len(data))
+                # GRID files store these fields as 4 byte floats, so keep
+                # the vector calculations in single precision instead of
+                # letting the MLT shift promote them to doubles
+                vel = np.asarray(data, dtype=np.float32)
+                kvect = np.asarray(azm_v, dtype=np.float32)
 
                 # Angle to "rotate" each vector by to get into same
                 # reference frame Controlled by longitude, or "mltitude"
-                alpha = thetas_calc
+                alpha = thetas_calc.astype(np.float32, copy=False)
+                cos_alpha = np.cos(alpha)
+                sin_alpha = np.sin(alpha)
 
                 # Convert initial positions to Cartesian
-                start_pos_x = (90 - abs(rs_calc)) * np.cos(thetas_calc)
-                start_pos_y = (90 - abs(rs_calc)) * np.sin(thetas_calc)
-
-                # Resolve LOS vector in x and y directions,
-                # with respect to mag pole
-                # Gives zonal and meridional components of LOS vector
-                los_x = -data * np.cos(np.radians(
-                                       -azm_v * hemisphere.value))
-                los_y = -data * np.sin(np.radians(
-                                       -azm_v * hemisphere.value))
-
-                # Rotate each vector into same reference frame
-                # following vector rotation matrix
-                # https://en.wikipedia.org/wiki/Rotation_matrix
-                vec_x = (los_x * np.cos(alpha)) - (los_y * np.sin(alpha))
-                vec_y = (los_x * np.sin(alpha)) + (los_y * np.cos(alpha))
-
-                # New vector end points, in Cartesian
-                end_pos_x = start_pos_x + (vec_x * hemisphere.value /
-                                           len_factor)
-                end_pos_y = start_pos_y + (vec_y * hemisphere.value /
-                                           len_factor)
+                start_r = 90 - abs(np.asarray(rs_calc, dtype=np.float32))
+                start_pos_x = start_r * cos_alpha
+                start_pos_y = start_r * sin_alpha
+
+                # Resolving the LOS vector in x and y directions (zonal and
+                # meridional components with respect to the mag pole) and
+                # then rotating it into the same reference frame with the
+                # rotation matrix https://en.wikipedia.org/wiki/Rotation_matrix
+                # is a single rotation by the sum of the two angles
+                vec_angle = alpha - np.deg2rad(kvect * hemisphere.value)
+                vec_len = vel * (-hemisphere.value / len_factor)
+
+                # New vector end points, in Cartesian, built in place to
+                # avoid extra temporary arrays
+                end_pos_x = np.cos(vec_angle)
+                end_pos_x *= vec_len
+                end_pos_x += start_pos_x
+                end_pos_y = np.sin(vec_angle)
+                end_pos_y *= vec_len
+                end_pos_y += start_pos_y
 
                 # Convert back to polar for plotting
-                end_rs = 90 - (np.sqrt(end_pos_x**2 + end_pos_y**2))
+                end_rs = np.hypot(end_pos_x, end_pos_y)
+                np.subtract(90, end_rs, out=end_rs)
                 end_thetas = np.arctan2(end_pos_y, end_pos_x)
 
-                end_rs = end_rs * hemisphere.value
+                end_rs *= hemisphere.value
 
                 # Plot the vectors
                 if projs != Projs.GEO:
-                    for i in num_pts:
-                        plt.plot([thetas[i], end_thetas[i]],
-                                 [rs[i], end_rs[i]], c=cmap(norm(data[i])),
-                                 linewidth=0.5, transform=transform)
+                    end_points = (end_thetas, end_rs)
                 else:
                     # If proj is geographic, convert the end points into
                     # geographic positions to plot
@@ -321,27 +330,25 @@ class Grid():
                                                    np.degrees(end_thetas),
                                                    300, date,
                                                    method_code="A2G")
-                    for i in num_pts:
-                        # If the vector does not cross the meridian
-                        if np.sign(thetas[i]) == np.sign(end_g_thetas[i]):
-                            plt.plot([thetas[i], end_g_thetas[i]],
-                                 [rs[i], end_g_rs[i]],
-                                 c=cmap(norm(data[i])),
-                                 linewidth=0.5, transform=transform)
-                        # If the vector crosses the meridian then amend so that
-                        # the start and end are in the same sign
-                        else:
-                            if abs(end_g_thetas[i]) > 90:
-                                if end_g_thetas[i] < 0:
-                                    end_g_thetas[i] = end_g_thetas[i] + 360
-                                else:
-                                    thetas[i] = thetas[i] + 360
-                            # Vector plots correctly over the 0 meridian so
-                            # Nothing is done to correct that section
-                            plt.plot([thetas[i], end_g_thetas[i]],
-                                 [rs[i], end_g_rs[i]],
-                                 c=cmap(norm(data[i])),
-                                 linewidth=0.5, transform=transform)
+                    # If the vector crosses the meridian then amend so that
+                    # the start and end are in the same sign
+                    # Vector plots correctly over the 0 meridian so
+                    # Nothing is done to correct that section
+                    crosses = (np.sign(thetas) != np.sign(end_g_thetas)) &\
+                        (abs(end_g_thetas) > 90)
+                    end_negative = end_g_thetas < 0
+                    end_g_thetas[crosses & end_negative] += 360
+                    thetas[crosses & ~end_negative] += 360
+                    end_points = (end_g_thetas, end_g_rs)
+
+                # Draw all the vectors as a single collection rather
+                # than one line per data point
+                segments = np.stack((thetas, rs) + end_points,
+                                    axis=-1).reshape(-1, 2, 2)
+                vectors = LineCollection(segments, cmap=cmap, norm=norm,
+                                         linewidths=0.5, transform=transform)
+                vectors.set_array(data)
+                ax.add_collection(vectors)
 
                 # TODO: Add a velocity reference vector
 
@@ -369,11 +376,10 @@ class Grid():
                               day=str(date.day).zfill(2),
                               start_hour=str(date.hour).zfill(2),
                               start_minute=str(date.minute).zfill(2),
-                              end_hour=str(dmap_data[record]['end.hour']).
-                              zfill(2),
-                              end_minute=str(dmap_data[record]['end.minute']).
+                              end_hour=str(dmap_record['end.hour']).zfill(2),
+                              end_minute=str(dmap_record['end.minute']).
                               zfill(2))
-        plt.title(title)
+        ax.set_title(title)
         if parameter == 'vector.vel.median':
             return thetas, end_thetas, rs, end_rs, data, azm_v
         return thetas, rs, data
@@ -981,7 +981,7 @@ class Maps():
         mlon = shifted_lons
 
         # Contained in function as too long to go into the function call
-        if contour_levels == []:
+        if len(contour_levels) == 0:
             contour_levels = [-100, -95, -90, -85, -80, -75, -70, -65, -60,
                               -55, -50, -45, -40, -35, -30, -25, -20, -15,
                               -10, -5, -1, 1, 5, 10, 15, 20, 25, 30, 35, 40,
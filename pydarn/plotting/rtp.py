@@ -286,7 +286,7 @@ class RTP():
             diff_time = 0.0
             if rec_time > end_time:
                 break
-            if x != []:
+            if x:
                 # 60.0 seconds in a minute
                 delta_diff_time = abs(rec_time - x[-1])
                 diff_time = delta_diff_time.seconds/60.0
@@ -21,7 +21,6 @@ quick conversions.
 """
 from typing import List
 import numpy as np
-from collections import OrderedDict
 
 
 # key is the format char type defined by python,
@@ -86,10 +85,12 @@ def dmap2dict(dmap_records: List[dict]) -> List[dict]:
         a list of dictionaries containing the name of the fields in the keys
         the data value(s) in the items of the dictionary
     """
+    # dict keeps the insertion order of the fields, no need to copy each
+    # record into an OrderedDict
     dmap_list = []
     for dmap_record in dmap_records:
         dmap_dict = {field: (data.value if isinstance(data.value, np.ndarray)
                      else DMAP_CASTING_TYPES[data.data_type_fmt](data.value))
                      for field, data in dmap_record.items()}
-        dmap_list.append(OrderedDict(dmap_dict))
+        dmap_list.append(dmap_dict)
     return dmap_list
@@ -355,7 +355,6 @@ class Boxcar(object):
             # self.filtered_data["scans"] = ray.get(futures)
             pass
         else:
-            from collections import OrderedDict
             scans = [
                 self.__do_filter__(scan_stack)
                 for scan_stack in self.scan_stacks
@@ -366,7 +365,7 @@ class Boxcar(object):
             self.filtered_data["scans"] = scans
             self.filtered_data["beams"] = beams
             self.filtered_data["beam_sounds"] = [
-                OrderedDict([(k, getattr(b, k)) for k in b.__dict__.keys()])
+                {k: getattr(b, k) for k in b.__dict__.keys()}
                 for b in beams
             ]
             # Format the data for pyDARN plotting and return the new
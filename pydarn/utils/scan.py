@@ -41,12 +41,12 @@ def build_scan(dmap_data: List[dict]):
     scan_mark = [sub['scan'] for sub in dmap_data]
     current_scan = 0
     beam_scan = np.zeros((len(dmap_data)))
-    for beam in range(len(dmap_data)):
+    for beam, mark in enumerate(scan_mark):
         # Absoloute value used due to some scan flags set as "-1"
-        if abs(scan_mark[beam]) == 1:
+        if abs(mark) == 1:
             current_scan += 1
             beam_scan[beam] = current_scan
-        if scan_mark[beam] == 0:
+        if mark == 0:
             beam_scan[beam] = current_scan
 
     return beam_scan
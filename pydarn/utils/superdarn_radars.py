@@ -110,10 +110,10 @@ def read_hdw_file(abbrv, date: datetime = None, update: bool = False):
         get_hdw_files(force=update)
     try:
         with open(hdw_file, 'r') as reader:
-            lines = reader.readlines()
-            for i in range(len(lines)):
-                if '#' not in lines[i] and len(lines[i].split()) > 1:
-                    hdw_data.append(lines[i].split())
+            for line in reader:
+                fields = line.split()
+                if '#' not in line and len(fields) > 1:
+                    hdw_data.append(fields)
                     """
                     Hardware files give the year and seconds from the beginning
                     of that year. Thus to check the date if it corresponds we
@@ -121,12 +121,12 @@ def read_hdw_file(abbrv, date: datetime = None, update: bool = False):
                     """
                     j = len(hdw_data)-1
                     hdw_lines_date.append(
-                        datetime(year=int(hdw_data[j][2][0:4]),
-                                 month=int(hdw_data[j][2][4:6]),
-                                 day=int(hdw_data[j][2][6:8]),
-                                 hour=int(hdw_data[j][3][0:2]),
-                                 minute=int(hdw_data[j][3][3:5]),
-                                 second=int(hdw_data[j][3][6:8])))
+                        datetime(year=int(fields[2][0:4]),
+                                 month=int(fields[2][4:6]),
+                                 day=int(fields[2][6:8]),
+                                 hour=int(fields[3][0:2]),
+                                 minute=int(fields[3][3:5]),
+                                 second=int(fields[3][6:8])))
                     if hdw_lines_date[j] > date:
                         j = j-1
                         break